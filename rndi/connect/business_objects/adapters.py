@@ -7,7 +7,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 from rndi.connect.business_objects.contracts import (
     AssetBuilder,
@@ -17,7 +18,15 @@ from rndi.connect.business_objects.contracts import (
     TierConfigurationBuilder,
     TierConfigurationSource,
 )
-from rndi.connect.business_objects.helpers import find_by_id, make_param, make_tier, merge, request_model
+from rndi.connect.business_objects.helpers import (
+    bulk_entry,
+    ensure_member,
+    index_by_id,
+    make_tier,
+    merge_inplace,
+    request_model,
+    update_param,
+)
 from rndi.connect.business_objects.exceptions import MissingItemError
 from rndi.connect.business_objects.mixin import (
     HasConfiguration,
@@ -39,13 +48,16 @@ class Request(
     RequestSource,
     RequestBuilder,
 ):
+    __slots__ = ('_data', '_cache')
+
     def __init__(self, request: Optional[dict] = None):
         request = {} if request is None else request
 
-        if not isinstance(request, dict):
+        if type(request) is not dict and not isinstance(request, dict):
             raise ValueError('Request must be a dictionary.')
 
         self._data = request
+        self._cache = {}
 
     def __repr__(self) -> str:
         return '{class_name}(request={request})'.format(
@@ -57,7 +69,7 @@ class Request(
         return str(self._data)
 
     def request_model(self) -> str:
-        return request_model(self.raw())
+        return request_model(self._data)
 
     def is_tier_config_request(self) -> bool:
         return 'tier-config' == self.request_model()
@@ -69,51 +81,61 @@ class Request(
         return self._data.get('id')
 
     def with_id(self, request_id: str) -> Request:
-        self._data.update({'id': request_id})
+        self._data['id'] = request_id
         return self
 
     def type(self) -> Optional[str]:
         return self._data.get('type')
 
     def with_type(self, request_type: str) -> Request:
-        self._data.update({'type': request_type})
+        self._data['type'] = request_type
         return self
 
     def status(self) -> Optional[str]:
         return self._data.get('status')
 
     def with_status(self, request_status) -> Request:
-        self._data.update({'status': request_status})
+        self._data['status'] = request_status
+        return self
+
+    def _datetime(self, key: str) -> Optional[datetime]:
+        value = self._data.get(key)
+        if value is None:
+            return None
+
+        cached = self._cache.get(key)
+        if cached is None or cached[0] is not value:
+            cached = self._cache[key] = (value, datetime.fromisoformat(value))
+        return cached[1]
+
+    def _with_datetime(self, key: str, value: datetime) -> Request:
+        self._data[key] = value.isoformat()
         return self
 
     def created(self) -> Optional[datetime]:
-        created = self._data.get('created')
-        return created if created is None else datetime.fromisoformat(created)
+        return self._datetime('created')
 
     def with_created(self, created: datetime) -> Request:
-        self._data.update({'created': created.isoformat()})
-        return self
+        return self._with_datetime('created', created)
 
     def updated(self) -> Optional[datetime]:
-        updated = self._data.get('updated')
-        return updated if updated is None else datetime.fromisoformat(updated)
+        return self._datetime('updated')
 
     def with_updated(self, updated: datetime) -> Request:
-        self._data.update({'updated': updated.isoformat()})
-        return self
+        return self._with_datetime('updated', updated)
 
     def note(self) -> Optional[str]:
         return self._data.get('note')
 
     def with_note(self, note: str) -> Request:
-        self._data.update({'note': note})
+        self._data['note'] = note
         return self
 
     def reason(self) -> Optional[str]:
         return self._data.get('reason')
 
     def with_reason(self, reason: str) -> Request:
-        self._data.update({'reason': reason})
+        self._data['reason'] = reason
         return self
 
     def assignee(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
@@ -124,25 +146,38 @@ class Request(
         return assignee if key is None else assignee.get(key, default)
 
     def with_assignee(self, assignee_id: str, assignee_name: str, assignee_email: str) -> Request:
-        self._data.update({'assignee': merge(self._data.get('assignee', {}), {
-            'id': assignee_id,
-            'name': assignee_name,
-            'email': assignee_email,
-        })})
+        assignee = ensure_member(self._data, 'assignee')
+        assignee['id'] = assignee_id
+        assignee['name'] = assignee_name
+        assignee['email'] = assignee_email
         return self
 
     def asset(self) -> Asset:
-        return Asset(self._data.get('asset', {}))
+        asset = self._data.get('asset')
+        if asset is None:
+            return Asset()
+
+        wrapper = self._cache.get('asset')
+        if wrapper is None or wrapper.raw() is not asset:
+            wrapper = self._cache['asset'] = Asset(asset)
+        return wrapper
 
     def with_asset(self, asset: Asset) -> Request:
-        self._data.update({'asset': asset.raw()})
+        self._data['asset'] = asset.raw()
         return self
 
     def tier_configuration(self) -> TierConfiguration:
-        return TierConfiguration(self._data.get('configuration', {}))
+        configuration = self._data.get('configuration')
+        if configuration is None:
+            return TierConfiguration()
+
+        wrapper = self._cache.get('configuration')
+        if wrapper is None or wrapper.raw() is not configuration:
+            wrapper = self._cache['configuration'] = TierConfiguration(configuration)
+        return wrapper
 
     def with_tier_configuration(self, configuration: TierConfiguration) -> Request:
-        self._data.update({'configuration': configuration.raw()})
+        self._data['configuration'] = configuration.raw()
         return self
 
 
@@ -157,14 +192,17 @@ class Asset(
     AssetSource,
     AssetBuilder,
 ):
+    __slots__ = ('_data', '_cache')
+
     def __init__(self, asset: Optional[dict] = None):
         if asset is None:
             asset = {}
 
-        if not isinstance(asset, dict):
+        if type(asset) is not dict and not isinstance(asset, dict):
             raise ValueError('Asset must be a dictionary.')
 
         self._data = asset
+        self._cache = {}
 
     def __repr__(self) -> str:
         return '{class_name}(asset={asset})'.format(
@@ -179,51 +217,46 @@ class Asset(
         return self._data.get('id')
 
     def with_id(self, asset_id: str) -> Asset:
-        self._data.update({'id': asset_id})
+        self._data['id'] = asset_id
         return self
 
     def external_id(self) -> Optional[str]:
         return self._data.get('external_id')
 
     def with_external_id(self, asset_external_id: str) -> Asset:
-        self._data.update({'external_id': asset_external_id})
+        self._data['external_id'] = asset_external_id
         return self
 
     def external_uid(self) -> Optional[str]:
         return self._data.get('external_uid')
 
     def with_external_uid(self, asset_external_uid: str) -> Asset:
-        self._data.update({'external_uid': asset_external_uid})
+        self._data['external_uid'] = asset_external_uid
         return self
 
     def status(self) -> Optional[str]:
         return self._data.get('status')
 
     def with_status(self, asset_status: str) -> Asset:
-        self._data.update({'status': asset_status})
+        self._data['status'] = asset_status
         return self
 
     def tier(self, tier_name: str, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        tier = self._data.get('tiers', {}).get(tier_name)
+        tiers = self._data.get('tiers')
+        tier = None if tiers is None else tiers.get(tier_name)
         if tier is None:
             return None
 
         return tier if key is None else tier.get(key, default)
 
     def with_tier(self, tier_name: str, tier: Union[str, dict]) -> Asset:
-        if 'tiers' not in self._data:
-            self._data.update({'tiers': {}})
-
-        if tier_name not in self._data.get('tiers', {}):
-            self._data.get('tiers', {}).update({tier_name: {}})
+        current = ensure_member(ensure_member(self._data, 'tiers'), tier_name)
 
         if isinstance(tier, str):
-            self._data.get('tiers', {}).get(tier_name, {}).clear()
+            current.clear()
             tier = make_tier(tier_name) if tier == 'random' else {'id': tier}
 
-        self._data.get('tiers', {}).get(tier_name).update(
-            merge(self._data.get('tiers', {}).get(tier_name), tier),
-        )
+        merge_inplace(current, tier)
         return self
 
     def tier_customer(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
@@ -247,16 +280,30 @@ class Asset(
     def items(self) -> List[Dict[Any, Any]]:
         return self._data.get('items', [])
 
+    def items_map(self) -> Mapping[str, Dict[Any, Any]]:
+        return MappingProxyType(index_by_id(self.items()))
+
+    def items_columns(self) -> Dict[str, List[Any]]:
+        items = self.items()
+        return {
+            'id': [item.get('id') for item in items],
+            'mpn': [item.get('mpn') for item in items],
+            'quantity': [item.get('quantity') for item in items],
+        }
+
     def item(self, item_id: str, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        item = find_by_id(self.items(), item_id)
+        item = self._find('items', self.items(), item_id)
         if item is None:
             raise MissingItemError(f'Missing item {item_id}', item_id)
 
         return item if key is None else item.get(key, default)
 
     def with_items(self, items: List[dict]) -> Asset:
-        for item in items:
-            self.with_item(**item)
+        if items:
+            elements = ensure_member(self._data, 'items', list)
+            with self._indexed('items', elements):
+                for item in items:
+                    self._with_item(elements, **bulk_entry(item, 'item_id'))
         return self
 
     def with_item(
@@ -272,31 +319,68 @@ class Asset(
             global_id: Optional[str] = None,
             params: Optional[List[dict]] = None,
     ) -> Asset:
-        try:
-            item = self.item(item_id)
-        except MissingItemError:
-            item = {'id': item_id}
-            self._data.update({'items': self.items() + [item]})
-
-        members = {
-            'global_id': global_id,
-            'display_name': display_name,
-            'mpn': item_mpn,
-            'quantity': quantity,
-            'old_quantity': old_quantity,
-            'params': [],
-            'item_type': item_type,
-            'period': period,
-            'type': unit,
-        }
+        return self._with_item(
+            ensure_member(self._data, 'items', list),
+            item_id,
+            item_mpn,
+            quantity,
+            old_quantity,
+            item_type,
+            period,
+            unit,
+            display_name,
+            global_id,
+            params,
+        )
 
-        item.update({k: v for k, v in members.items() if v is not None})
-        self.with_item_params(item_id, [] if params is None else params)
+    def _with_item(
+            self,
+            elements: List[dict],
+            item_id: str,
+            item_mpn: str,
+            quantity: str = '1',
+            old_quantity: Optional[str] = None,
+            item_type: Optional[str] = None,
+            period: Optional[str] = None,
+            unit: Optional[str] = None,
+            display_name: Optional[str] = None,
+            global_id: Optional[str] = None,
+            params: Optional[List[dict]] = None,
+    ) -> Asset:
+        item = self._find('items', elements, item_id)
+        if item is None:
+            item = self._append('items', elements, {'id': item_id})
+
+        if global_id is not None:
+            item['global_id'] = global_id
+        if display_name is not None:
+            item['display_name'] = display_name
+        if item_mpn is not None:
+            item['mpn'] = item_mpn
+        if quantity is not None:
+            item['quantity'] = quantity
+        if old_quantity is not None:
+            item['old_quantity'] = old_quantity
+        item['params'] = []
+        if item_type is not None:
+            item['item_type'] = item_type
+        if period is not None:
+            item['period'] = period
+        if unit is not None:
+            item['type'] = unit
+
+        if params:
+            with self._indexed(('items.params', item_id), item['params']):
+                for param in params:
+                    self._with_item_param(item, **bulk_entry(param, 'param_id'))
         return self
 
     def item_params(self, item_id: str) -> List[Dict[Any, Any]]:
         return self.item(item_id, 'params', [])
 
+    def item_params_map(self, item_id: str) -> Mapping[str, Dict[Any, Any]]:
+        return MappingProxyType(index_by_id(self.item_params(item_id)))
+
     def item_param(
             self,
             item_id: str,
@@ -304,15 +388,18 @@ class Asset(
             key: Optional[str] = None,
             default: Optional[Any] = None,
     ) -> Optional[Any]:
-        param = find_by_id(self.item(item_id, 'params', []), param_id)
+        param = self._find(('items.params', item_id), self.item_params(item_id), param_id)
         if param is None:
             raise MissingItemError(f'Missing item {param_id} in item {item_id}', item_id)
 
         return param if key is None else param.get(key, default)
 
     def with_item_params(self, item_id: str, params: List[dict]) -> Asset:
-        for param in params:
-            self.with_item_param(**{'item_id': item_id, **param})
+        if params:
+            item = self.item(item_id)
+            with self._indexed(('items.params', item_id), ensure_member(item, 'params', list)):
+                for param in params:
+                    self._with_item_param(item, **bulk_entry(param, 'param_id'))
         return self
 
     def with_item_param(
@@ -326,13 +413,35 @@ class Asset(
             scope: Optional[str] = None,
             phase: Optional[str] = None,
     ) -> Asset:
-        item = self.item(item_id)
-        param = find_by_id(item.get('params', []), param_id)
+        return self._with_item_param(
+            self.item(item_id),
+            param_id,
+            value,
+            value_type,
+            title,
+            description,
+            scope,
+            phase,
+        )
+
+    def _with_item_param(
+            self,
+            item: dict,
+            param_id: str,
+            value: Optional[Union[str, dict, list]] = None,
+            value_type: Optional[str] = None,
+            title: Optional[str] = None,
+            description: Optional[str] = None,
+            scope: Optional[str] = None,
+            phase: Optional[str] = None,
+    ) -> Asset:
+        params = ensure_member(item, 'params', list)
+        param = self._find(('items.params', item['id']), params, param_id)
         if param is None:
-            param = {'id': param_id}
-            item.get('params', []).append(param)
+            param = self._append(('items.params', item['id']), params, {'id': param_id})
 
-        members = make_param(
+        update_param(
+            param,
             param_id,
             value,
             None,
@@ -342,7 +451,6 @@ class Asset(
             'item' if scope is None else scope,
             'configuration' if phase is None else phase,
         )
-        param.update({k: v for k, v in members.items() if v is not None})
         return self
 
 
@@ -356,14 +464,17 @@ class TierConfiguration(
     TierConfigurationSource,
     TierConfigurationBuilder,
 ):
+    __slots__ = ('_data', '_cache')
+
     def __init__(self, tier_config: Optional[dict] = None):
         if tier_config is None:
             tier_config = {}
 
-        if not isinstance(tier_config, dict):
+        if type(tier_config) is not dict and not isinstance(tier_config, dict):
             raise ValueError('Tier Configuration must be a dictionary.')
 
         self._data = tier_config
+        self._cache = {}
 
     def __repr__(self) -> str:
         return '{class_name}(tier_config={tier_config})'.format(
@@ -378,14 +489,14 @@ class TierConfiguration(
         return self._data.get('id')
 
     def with_id(self, tier_configuration_id: str) -> TierConfiguration:
-        self._data.update({'id': tier_configuration_id})
+        self._data['id'] = tier_configuration_id
         return self
 
     def status(self) -> Optional[str]:
         return self._data.get('status')
 
     def with_status(self, tier_configuration_status: str) -> TierConfiguration:
-        self._data.update({'status': tier_configuration_status})
+        self._data['status'] = tier_configuration_status
         return self
 
     def account(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
@@ -396,16 +507,18 @@ class TierConfiguration(
         return account if key is None else account.get(key, default)
 
     def with_account(self, account: Optional[Union[str, dict]] = 'random') -> TierConfiguration:
+        current = ensure_member(self._data, 'account')
+
         if isinstance(account, str):
-            self._data.get('account', {}).clear()
+            current.clear()
             account = make_tier('reseller') if account == 'random' else {'id': account}
 
-        self._data.update({'account': merge(self._data.get('account', {}), account)})
+        merge_inplace(current, account)
         return self
 
     def tier_level(self) -> Optional[int]:
         return self._data.get('tier_level')
 
     def with_tier_level(self, level: int) -> TierConfiguration:
-        self._data.update({'tier_level': level})
+        self._data['tier_level'] = level
         return self
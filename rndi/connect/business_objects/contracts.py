@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Dict, List, Mapping, Optional, TypeVar, Union
 
 TConfigurationBuilder = TypeVar('TConfigurationBuilder', bound='ConfigurationBuilder')
 TConnectionBuilder = TypeVar('TConnectionBuilder', bound='ConnectionBuilder')
@@ -22,6 +22,8 @@ TTierConfigurationBuilder = TypeVar('TTierConfigurationBuilder', bound='TierConf
 
 
 class ConfigurationSource(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def configuration_params(self) -> List[Dict[Any, Any]]:
         """
@@ -29,6 +31,13 @@ class ConfigurationSource(ABC):
         :return: List[Dict[Any, Any]]
         """
 
+    @abstractmethod
+    def configuration_params_map(self) -> Mapping[str, Dict[Any, Any]]:
+        """
+        Provide the configuration parameters indexed by id.
+        :return: Mapping[str, Dict[Any, Any]]
+        """
+
     @abstractmethod
     def configuration_param(
             self,
@@ -46,6 +55,8 @@ class ConfigurationSource(ABC):
 
 
 class ConfigurationBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_configuration_params(self, params: List[dict]) -> TConfigurationBuilder:
         """
@@ -77,6 +88,8 @@ class ConfigurationBuilder(ABC):
 
 
 class ConnectionSource(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def connection(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -115,6 +128,8 @@ class ConnectionSource(ABC):
 
 
 class ConnectionBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_connection(
             self,
@@ -163,6 +178,8 @@ class ConnectionBuilder(ABC):
 
 
 class ContractSource(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def contract(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -174,6 +191,8 @@ class ContractSource(ABC):
 
 
 class ContractBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_contract(self, contract_id: str, contract_name: Optional[str] = None) -> TContractBuilder:
         """
@@ -185,6 +204,8 @@ class ContractBuilder(ABC):
 
 
 class EventsSource(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def events(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -196,6 +217,8 @@ class EventsSource(ABC):
 
 
 class EventsBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_events(self, created: datetime, updated: datetime) -> TEventsBuilder:
         """
@@ -207,6 +230,8 @@ class EventsBuilder(ABC):
 
 
 class MarketplaceSource(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def marketplace(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -218,6 +243,8 @@ class MarketplaceSource(ABC):
 
 
 class MarketPlaceBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_marketplace(self, marketplace_id: str, marketplace_name: Optional[str] = None) -> TMarketPlaceBuilder:
         """
@@ -229,6 +256,8 @@ class MarketPlaceBuilder(ABC):
 
 
 class ParametersSource(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def params(self) -> List[Dict[Any, Any]]:
         """
@@ -236,6 +265,13 @@ class ParametersSource(ABC):
         :return: List[Dict[Any, Any]] The list of parameters.
         """
 
+    @abstractmethod
+    def params_map(self) -> Mapping[str, Dict[Any, Any]]:
+        """
+        Provide the parameters indexed by id.
+        :return: Mapping[str, Dict[Any, Any]] The parameters by id.
+        """
+
     @abstractmethod
     def param(self, param_id: str, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -249,6 +285,8 @@ class ParametersSource(ABC):
 
 
 class ParametersBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_params(self, params: List[dict]) -> TParametersBuilder:
         """
@@ -278,6 +316,8 @@ class ParametersBuilder(ABC):
 
 
 class ProductSource(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def product(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -289,6 +329,8 @@ class ProductSource(ABC):
 
 
 class ProductBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_product(self, product_id: str, product_status: str = 'published') -> TProductBuilder:
         """
@@ -300,6 +342,8 @@ class ProductBuilder(ABC):
 
 
 class RequestSource(ContractSource, EventsSource, MarketplaceSource, ParametersSource, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def request_model(self) -> str:
         """
@@ -396,6 +440,8 @@ class RequestSource(ContractSource, EventsSource, MarketplaceSource, ParametersS
 
 
 class RequestBuilder(ContractBuilder, EventsBuilder, MarketPlaceBuilder, ParametersBuilder, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def with_id(self, request_id: str) -> TRequestBuilder:
         """
@@ -488,6 +534,8 @@ class AssetSource(
     ProductSource,
     ABC,
 ):
+    __slots__ = ()
+
     @abstractmethod
     def id(self) -> Optional[str]:
         """
@@ -557,6 +605,20 @@ class AssetSource(
         :return: List[Dict[Any, Any]]
         """
 
+    @abstractmethod
+    def items_map(self) -> Mapping[str, Dict[Any, Any]]:
+        """
+        Provides the asset items indexed by id.
+        :return: Mapping[str, Dict[Any, Any]]
+        """
+
+    @abstractmethod
+    def items_columns(self) -> Dict[str, List[Any]]:
+        """
+        Provides the id, mpn and quantity of the asset items as one list per column.
+        :return: Dict[str, List[Any]]
+        """
+
     @abstractmethod
     def item(self, item_id: str, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -576,6 +638,15 @@ class AssetSource(
         :return: List[Dict[Any, Any]]
         """
 
+    @abstractmethod
+    def item_params_map(self, item_id: str) -> Mapping[str, Dict[Any, Any]]:
+        """
+        Provide the parameters of an item by id indexed by parameter id.
+        :param item_id: str The unique item id.
+        :raises: MissingItemError If the requested item by id is not available.
+        :return: Mapping[str, Dict[Any, Any]]
+        """
+
     @abstractmethod
     def item_param(
             self,
@@ -604,6 +675,8 @@ class AssetBuilder(
     ProductBuilder,
     ABC,
 ):
+    __slots__ = ()
+
     @abstractmethod
     def with_id(self, asset_id: str) -> TAssetBuilder:
         """
@@ -749,6 +822,8 @@ class TierConfigurationSource(
     ProductSource,
     ABC,
 ):
+    __slots__ = ()
+
     @abstractmethod
     def id(self) -> Optional[str]:
         """
@@ -788,6 +863,8 @@ class TierConfigurationBuilder(
     ProductBuilder,
     ABC,
 ):
+    __slots__ = ()
+
     @abstractmethod
     def with_id(self, tier_configuration_id: str) -> TTierConfigurationBuilder:
         """
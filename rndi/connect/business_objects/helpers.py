@@ -4,7 +4,8 @@
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
 from copy import deepcopy
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from faker import Faker
 
@@ -18,10 +19,78 @@ def find_by_id(elements: List[dict], element_id: str, default: Optional[dict] =
     :param default: Default value to return if item is not found.
     :return: The parameter/list, or ``default`` if it was not found.
     """
-    try:
-        return next(filter(lambda element: element['id'] == element_id, elements))
-    except StopIteration:
-        return default
+    for element in elements:
+        if element['id'] == element_id:
+            return element
+    return default
+
+
+def index_by_id(elements: List[dict]) -> Dict[str, dict]:
+    """
+    Builds a dictionary of the given parameters/items by ``id``.
+
+    If an ``id`` is repeated the first element wins, same as ``find_by_id``.
+
+    :param elements: The list of parameters/items to index.
+    :return: Dict[str, dict] The parameters/items by id.
+    """
+    index = {}
+    for element in elements:
+        index.setdefault(element['id'], element)
+    return index
+
+
+def bulk_entry(entry: dict, id_key: str) -> dict:
+    """
+    Provides a bulk setter entry with its id under ``id_key``, accepting ``id`` as an alias.
+
+    :param entry: The bulk setter entry, the keyword arguments of the single setter.
+    :param id_key: The name of the id argument (``param_id``, ``item_id``...).
+    :return: dict The entry, or a renamed copy of it if the alias was used.
+    """
+    if id_key not in entry and 'id' in entry:
+        entry = dict(entry)
+        entry[id_key] = entry.pop('id')
+    return entry
+
+
+def ensure_member(container: dict, key: str, factory: Callable[[], Any] = dict) -> Any:
+    """
+    Provides the member of the given container, creating it if it is missing or ``None``.
+
+    :param container: The dictionary that holds the member.
+    :param key: The member key.
+    :param factory: Builds the empty member, a dictionary by default.
+    :return: The existing or the new member.
+    """
+    member = container.get(key)
+    if member is None:
+        member = container[key] = factory()
+    return member
+
+
+_ATOMIC_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def clone(element: Any) -> Any:
+    """
+    Deep copy the given JSON-like structure (dicts, lists and scalars).
+
+    Plain dicts and lists are rebuilt recursively and scalars are returned
+    as they are, any other type falls back to ``deepcopy``.
+
+    :param element: The structure to copy.
+    :return: The copied structure.
+    """
+    element_type = type(element)
+    if element_type is dict:
+        return {key: clone(value) for key, value in element.items()}
+    if element_type is list:
+        return [clone(value) for value in element]
+    if element_type in _ATOMIC_TYPES:
+        return element
+
+    return deepcopy(element)
 
 
 def merge(base: dict, override: dict) -> dict:
@@ -32,23 +101,47 @@ def merge(base: dict, override: dict) -> dict:
     :param override: Override dictionary to be merged into base.
     :return dict: The new dictionary.
     """
-    new_base = deepcopy(base)
-    for key, value in override.items():
-        if key in new_base:
-            if isinstance(new_base[key], dict) and isinstance(value, dict):
-                new_base[key] = merge(new_base[key], value)
-            elif isinstance(new_base[key], list) and isinstance(value, list):
-                new_base[key].extend(value)
+    return merge_inplace(clone(base), override)
+
+
+def merge_inplace(base: dict, override: dict) -> dict:
+    """
+    Merge two dictionaries (override into base) recursively, modifying base.
+
+    Values taken from override are copied, so later merges into base never
+    modify the override structures.
+
+    :param base: The base dictionary, updated in place.
+    :param override: Override dictionary to be merged into base.
+    :return dict: The base dictionary.
+    """
+    stack = [(base, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if key in target:
+                current = target[key]
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                elif isinstance(current, list) and isinstance(value, list):
+                    current.extend([clone(element) for element in value])
+                else:
+                    target[key] = clone(value)
             else:
-                new_base[key] = value
-        else:
-            new_base[key] = value
+                target[key] = clone(value)
+
+    return base
+
 
-    return new_base
+@lru_cache(maxsize=16)
+def _faker(locale: Tuple[str, ...]) -> Faker:
+    return Faker(list(locale))
 
 
-def make_tier(tier_type: str = 'customer', locale: List[str] = None) -> dict:
-    faker = Faker(['en_US'] if locale is None else locale)
+def make_tier(tier_type: str = 'customer', locale: Optional[Union[str, List[str]]] = None) -> dict:
+    if locale is None:
+        locale = ('en_US',)
+    faker = _faker((locale,) if isinstance(locale, str) else tuple(locale))
     return {
         "name": faker.company(),
         "type": tier_type,
@@ -76,6 +169,10 @@ def make_tier(tier_type: str = 'customer', locale: List[str] = None) -> dict:
     }
 
 
+def _value_member(value: Any) -> str:
+    return 'structured_value' if isinstance(value, (dict, list)) else 'value'
+
+
 def make_param(
         param_id: str,
         value: Optional[Union[str, dict]] = None,
@@ -86,16 +183,65 @@ def make_param(
         scope: Optional[str] = None,
         phase: Optional[str] = None,
 ) -> dict:
-    return {
-        'id': param_id,
-        'structured_value' if type(value) in [object, dict, list] else 'value': value,
-        'value_error': value_error,
-        'title': f'Parameter {param_id} title.' if title is None else title,
-        'description': f'Parameter {param_id} description.' if description is None else description,
-        'type': 'text' if value_type is None else value_type,
-        'scope': scope,
-        'phase': phase,
-    }
+    # all the members are listed to keep their order, update_param fills the defaults.
+    param = dict.fromkeys(['id', _value_member(value), 'value_error', 'title', 'description', 'type', 'scope', 'phase'])
+    return update_param(param, param_id, value, value_error, value_type, title, description, scope, phase)
+
+
+def update_param(
+        param: dict,
+        param_id: str,
+        value: Optional[Union[str, dict]] = None,
+        value_error: Optional[str] = None,
+        value_type: Optional[str] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        scope: Optional[str] = None,
+        phase: Optional[str] = None,
+) -> dict:
+    """
+    Writes the parameter members into the given parameter, skipping the ones without
+    value. The defaults live here, ``make_param`` builds new parameters on top of it.
+
+    :param param: The parameter to update.
+    :param param_id: The parameter id.
+    :param value: The parameter value, stored as structured value if it is a dict or list.
+    :param value_error: The parameter value error.
+    :param value_type: The parameter type, text by default.
+    :param title: The parameter title, a generic one by default.
+    :param description: The parameter description, a generic one by default.
+    :param scope: The parameter scope.
+    :param phase: The parameter phase.
+    :return: dict The updated parameter.
+    """
+    param['id'] = param_id
+    if value is not None:
+        param[_value_member(value)] = value
+    if value_error is not None:
+        param['value_error'] = value_error
+    param['title'] = f'Parameter {param_id} title.' if title is None else title
+    param['description'] = f'Parameter {param_id} description.' if description is None else description
+    param['type'] = 'text' if value_type is None else value_type
+    if scope is not None:
+        param['scope'] = scope
+    if phase is not None:
+        param['phase'] = phase
+    return param
+
+
+_ASSET_REQUEST_TYPES = ('adjustment', 'purchase', 'change', 'suspend', 'resume', 'cancel')
+_TIER_CONFIG_REQUEST_TYPES = ('setup', 'update', 'adjustment')
+
+# (has asset, has configuration, type) -> model.
+_REQUEST_MODELS_BY_SHAPE: Dict[Tuple[bool, bool, str], str] = {}
+for _request_type in _TIER_CONFIG_REQUEST_TYPES:
+    _REQUEST_MODELS_BY_SHAPE[(True, True, _request_type)] = 'tier-config'
+    _REQUEST_MODELS_BY_SHAPE[(False, True, _request_type)] = 'tier-config'
+# the asset model goes last, it wins when a request looks like both models.
+for _request_type in _ASSET_REQUEST_TYPES:
+    _REQUEST_MODELS_BY_SHAPE[(True, True, _request_type)] = 'asset'
+    _REQUEST_MODELS_BY_SHAPE[(True, False, _request_type)] = 'asset'
+del _request_type
 
 
 def request_model(request: dict) -> str:
@@ -105,22 +251,11 @@ def request_model(request: dict) -> str:
     :param request: dict
     :return: str
     """
-
-    def match_request_type(model: dict) -> bool:
-        return model.get('object') in request and request.get('type') in model.get('types')
-
-    try:
-        return next(filter(match_request_type, [
-            {
-                'request': 'asset',
-                'object': 'asset',
-                'types': ['adjustment', 'purchase', 'change', 'suspend', 'resume', 'cancel'],
-            },
-            {
-                'request': 'tier-config',
-                'object': 'configuration',
-                'types': ['setup', 'update', 'adjustment'],
-            },
-        ])).get('request')
-    except StopIteration:
+    request_type = request.get('type')
+    if not isinstance(request_type, str):
         return 'undefined'
+
+    return _REQUEST_MODELS_BY_SHAPE.get(
+        ('asset' in request, 'configuration' in request, request_type),
+        'undefined',
+    )
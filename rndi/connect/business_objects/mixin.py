@@ -3,12 +3,14 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple, TypeVar, Union
 
 from rndi.connect.business_objects.exceptions import MissingParameterError
-from rndi.connect.business_objects.helpers import find_by_id, make_param, merge
+from rndi.connect.business_objects.helpers import bulk_entry, clone, ensure_member, index_by_id, update_param
 
 THasConfiguration = TypeVar('THasConfiguration', bound='HasConfiguration')
 THasConnection = TypeVar('THasConnection', bound='HasConnection')
@@ -20,11 +22,92 @@ THasProduct = TypeVar('THasProduct', bound='HasProduct')
 THasReadWriteOperations = TypeVar('THasReadWriteOperations', bound='HasReadWriteOperations')
 
 
-class HasConfiguration:
+def _instance_state(instance: object) -> Dict[str, Any]:
+    state = dict(getattr(instance, '__dict__', {}))
+    for cls in type(instance).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__') and name not in state and hasattr(instance, name):
+                state[name] = getattr(instance, name)
+    return state
+
+
+class HasCache:
+    __slots__ = ()
+
+    _cache: dict
+
+    def _caches(self) -> dict:
+        try:
+            return self._cache
+        except AttributeError:
+            # classes built on the mixins may only provide _data.
+            cache = self._cache = {}
+            return cache
+
+
+class HasIndexes(HasCache):
+    __slots__ = ()
+
+    def _reindex(self, name: Hashable, elements: List[dict]) -> list:
+        positions = {}
+        for position, element in enumerate(elements):
+            positions.setdefault(element['id'], position)
+        entry = self._caches()[name] = [elements, positions, False]
+        return entry
+
+    @contextmanager
+    def _indexed(self, name: Hashable, elements: List[dict]) -> Iterator[None]:
+        # the elements can only be modified by the batch while it runs, so the
+        # index is rebuilt once and its misses can be trusted until it ends.
+        entry = self._reindex(name, elements)
+        entry[2] = True
+        try:
+            yield
+        finally:
+            entry[2] = False
+
+    def _find(self, name: Hashable, elements: List[dict], element_id: str) -> Optional[dict]:
+        entry = self._caches().get(name)
+        rebuilt = entry is None or entry[0] is not elements
+        if rebuilt:
+            entry = self._reindex(name, elements)
+
+        position = entry[1].get(element_id)
+        if position is None:
+            if rebuilt or entry[2]:
+                return None
+        elif position < len(elements) and elements[position]['id'] == element_id:
+            return elements[position]
+
+        # the elements may have been changed from outside, so the miss is verified
+        # with a plain scan and the index is only rebuilt if it was actually stale.
+        for element in elements:
+            if element['id'] == element_id:
+                self._reindex(name, elements)
+                return element
+        return None
+
+    def _append(self, name: Hashable, elements: List[dict], element: dict) -> dict:
+        entry = self._caches().get(name)
+        if entry is None or entry[0] is not elements:
+            entry = self._reindex(name, elements)
+        entry[1][element['id']] = len(elements)
+        elements.append(element)
+        return element
+
+
+class HasConfiguration(HasIndexes):
+    __slots__ = ()
+
     _data: dict
 
     def configuration_params(self) -> List[dict]:
-        return self._data.get('configuration', {}).get('params', [])
+        configuration = self._data.get('configuration')
+        return [] if configuration is None else configuration.get('params', [])
+
+    def configuration_params_map(self) -> Mapping[str, Dict[Any, Any]]:
+        return MappingProxyType(index_by_id(self.configuration_params()))
 
     def configuration_param(
             self,
@@ -32,15 +115,18 @@ class HasConfiguration:
             key: Optional[str] = None,
             default: Optional[Any] = None,
     ) -> Optional[Any]:
-        parameter = find_by_id(self.configuration_params(), param_id)
+        parameter = self._find('configuration.params', self.configuration_params(), param_id)
         if parameter is None:
             raise MissingParameterError(f'Missing parameter {param_id}', param_id)
 
         return parameter if key is None else parameter.get(key, default)
 
     def with_configuration_params(self, params: List[dict]) -> THasConfiguration:
-        for param in params:
-            self.with_configuration_param(**param)
+        if params:
+            elements = ensure_member(ensure_member(self._data, 'configuration'), 'params', list)
+            with self._indexed('configuration.params', elements):
+                for param in params:
+                    self._with_configuration_param(elements, **bulk_entry(param, 'param_id'))
         return self
 
     def with_configuration_param(
@@ -52,32 +138,39 @@ class HasConfiguration:
             title: Optional[str] = None,
             description: Optional[str] = None,
     ) -> THasConfiguration:
-        if 'configuration' not in self._data:
-            self._data.update({'configuration': {}})
-
-        if 'params' not in self._data.get('configuration', {}):
-            self._data.get('configuration', {}).update({'params': []})
+        elements = ensure_member(ensure_member(self._data, 'configuration'), 'params', list)
+        return self._with_configuration_param(elements, param_id, value, value_error, value_type, title, description)
 
-        try:
-            param = self.configuration_param(param_id)
-        except MissingParameterError:
-            param = {'id': param_id}
-            self._data.get('configuration', {}).get('params', []).append(param)
+    def _with_configuration_param(
+            self,
+            elements: List[dict],
+            param_id: str,
+            value: Optional[Union[str, dict, list]] = None,
+            value_error: Optional[str] = None,
+            value_type: Optional[str] = None,
+            title: Optional[str] = None,
+            description: Optional[str] = None,
+    ) -> THasConfiguration:
+        param = self._find('configuration.params', elements, param_id)
+        if param is None:
+            param = self._append('configuration.params', elements, {'id': param_id})
 
-        members = make_param(param_id, value, value_error, value_type, title, description)
-        param.update({k: v for k, v in members.items() if v is not None})
+        update_param(param, param_id, value, value_error, value_type, title, description)
         return self
 
 
 class HasConnection:
+    __slots__ = ()
+
     _data: dict
 
     def connection(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        connection = self._data.get('connection')
-        if connection is None:
+        try:
+            connection = self._data['connection']
+        except KeyError:
             return None
 
-        return connection if key is None else connection.get(key, default)
+        return connection if key is None or connection is None else connection.get(key, default)
 
     def with_connection(
             self,
@@ -87,10 +180,9 @@ class HasConnection:
             vendor: Optional[dict] = None,
             hub: Optional[dict] = None,
     ) -> THasConnection:
-        self._data.update({'connection': merge(self._data.get('connection', {}), {
-            'id': connection_id,
-            'type': connection_type,
-        })})
+        connection = ensure_member(self._data, 'connection')
+        connection['id'] = connection_id
+        connection['type'] = connection_type
         if provider is not None:
             self.with_connection_provider(provider_id=provider.get('id'), provider_name=provider.get('name'))
         if vendor is not None:
@@ -100,49 +192,51 @@ class HasConnection:
         return self
 
     def connection_provider(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        provider = self.connection('provider')
+        connection = self._data.get('connection')
+        provider = None if connection is None else connection.get('provider')
         if provider is None:
             return None
 
         return provider if key is None else provider.get(key, default)
 
     def with_connection_provider(self, provider_id: str, provider_name: Optional[str] = None) -> THasConnection:
-        self._data.update({'connection': merge(self._data.get('connection', {}), {'provider': {
-            'id': provider_id,
-            'name': provider_name,
-        }})})
+        provider = ensure_member(ensure_member(self._data, 'connection'), 'provider')
+        provider['id'] = provider_id
+        provider['name'] = provider_name
         return self
 
     def connection_vendor(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        vendor = self.connection('vendor')
+        connection = self._data.get('connection')
+        vendor = None if connection is None else connection.get('vendor')
         if vendor is None:
             return None
 
         return vendor if key is None else vendor.get(key, default)
 
     def with_connection_vendor(self, vendor_id: str, vendor_name: Optional[str] = None) -> THasConnection:
-        self._data.update({'connection': merge(self._data.get('connection', {}), {'vendor': {
-            'id': vendor_id,
-            'name': vendor_name,
-        }})})
+        vendor = ensure_member(ensure_member(self._data, 'connection'), 'vendor')
+        vendor['id'] = vendor_id
+        vendor['name'] = vendor_name
         return self
 
     def connection_hub(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        hub = self.connection('hub')
+        connection = self._data.get('connection')
+        hub = None if connection is None else connection.get('hub')
         if hub is None:
             return None
 
         return hub if key is None else hub.get(key, default)
 
     def with_connection_hub(self, hub_id: str, hub_name: Optional[str] = None) -> THasConnection:
-        self._data.update({'connection': merge(self._data.get('connection', {}), {'hub': {
-            'id': hub_id,
-            'name': hub_name,
-        }})})
+        hub = ensure_member(ensure_member(self._data, 'connection'), 'hub')
+        hub['id'] = hub_id
+        hub['name'] = hub_name
         return self
 
 
 class HasContract:
+    __slots__ = ()
+
     _data: dict
 
     def contract(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
@@ -153,14 +247,15 @@ class HasContract:
         return contract if key is None else contract.get(key, default)
 
     def with_contract(self, contract_id: str, contract_name: Optional[str] = None) -> THasContract:
-        self._data.update({'contract': merge(self._data.get('contract', {}), {
-            'id': contract_id,
-            'name': contract_name,
-        })})
+        contract = ensure_member(self._data, 'contract')
+        contract['id'] = contract_id
+        contract['name'] = contract_name
         return self
 
 
 class HasEvents:
+    __slots__ = ()
+
     _data: dict
 
     def events(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
@@ -171,47 +266,56 @@ class HasEvents:
         return events if key is None else events.get(key, default)
 
     def with_events(self, created: datetime, updated: datetime) -> THasEvents:
-        self._data.update({'events': merge(self._data.get('events', {}), {
-            'created': {'at': created.isoformat()},
-            'updated': {'at': updated.isoformat()},
-        })})
+        events = ensure_member(self._data, 'events')
+        ensure_member(events, 'created')['at'] = created.isoformat()
+        ensure_member(events, 'updated')['at'] = updated.isoformat()
         return self
 
 
 class HasMarketplace:
+    __slots__ = ()
+
     _data: dict
 
     def marketplace(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        marketplace = self._data.get('marketplace')
-        if marketplace is None:
+        try:
+            marketplace = self._data['marketplace']
+        except KeyError:
             return None
 
-        return marketplace if key is None else marketplace.get(key, default)
+        return marketplace if key is None or marketplace is None else marketplace.get(key, default)
 
     def with_marketplace(self, marketplace_id: str, marketplace_name: Optional[str] = None) -> THasMarketplace:
-        self._data.update({'marketplace': merge(self._data.get('marketplace', {}), {
-            'id': marketplace_id,
-            'name': marketplace_name,
-        })})
+        marketplace = ensure_member(self._data, 'marketplace')
+        marketplace['id'] = marketplace_id
+        marketplace['name'] = marketplace_name
         return self
 
 
-class HasParameters:
+class HasParameters(HasIndexes):
+    __slots__ = ()
+
     _data: dict
 
     def params(self) -> List[Dict[Any, Any]]:
         return self._data.get('params', [])
 
+    def params_map(self) -> Mapping[str, Dict[Any, Any]]:
+        return MappingProxyType(index_by_id(self.params()))
+
     def param(self, param_id: str, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        parameter = find_by_id(self.params(), param_id)
+        parameter = self._find('params', self.params(), param_id)
         if parameter is None:
             raise MissingParameterError(f'Missing parameter {param_id}', param_id)
 
         return parameter if key is None else parameter.get(key, default)
 
     def with_params(self, params: List[dict]) -> THasParameters:
-        for param in params:
-            self.with_param(**param)
+        if params:
+            elements = ensure_member(self._data, 'params', list)
+            with self._indexed('params', elements):
+                for param in params:
+                    self._with_param(elements, **bulk_entry(param, 'param_id'))
         return self
 
     def with_param(
@@ -222,50 +326,124 @@ class HasParameters:
             value_type: str = 'text',
             create: bool = True,
     ) -> THasParameters:
-        try:
-            param = self.param(param_id)
-        except MissingParameterError:
+        elements = ensure_member(self._data, 'params', list) if create else (self.params() or [])
+        return self._with_param(elements, param_id, value, value_error, value_type, create)
+
+    def _with_param(
+            self,
+            elements: List[dict],
+            param_id: str,
+            value: Optional[Union[str, dict, list]] = None,
+            value_error: Optional[str] = None,
+            value_type: str = 'text',
+            create: bool = True,
+    ) -> THasParameters:
+        param = self._find('params', elements, param_id)
+        if param is None:
             if create is False:
-                raise
-            param = {'id': param_id}
-            self._data.update({'params': self.params() + [param]})
+                raise MissingParameterError(f'Missing parameter {param_id}', param_id)
+            param = self._append('params', elements, {'id': param_id})
 
-        members = make_param(param_id, value, value_error, value_type)
-        param.update({k: v for k, v in members.items() if v is not None})
+        update_param(param, param_id, value, value_error, value_type)
         return self
 
 
 class HasProduct:
+    __slots__ = ()
+
     _data: dict
 
     def product(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        product = self._data.get('product')
-        if product is None:
+        try:
+            product = self._data['product']
+        except KeyError:
             return None
 
-        return product if key is None else product.get(key, default)
+        return product if key is None or product is None else product.get(key, default)
 
     def with_product(self, product_id: str, product_status: str = 'published') -> THasProduct:
-        self._data.update({'product': merge(self._data.get('product', {}), {
-            'id': product_id,
-            'status': product_status,
-        })})
+        product = ensure_member(self._data, 'product')
+        product['id'] = product_id
+        product['status'] = product_status
         return self
 
 
-class HasReadWriteOperations:
+class HasReadWriteOperations(HasCache):
+    __slots__ = ()
+
     _data: dict
 
     def with_member(self, key: str, value: Any):
-        self._data.update({key: value})
+        self._data[key] = value
+        self._caches().clear()
         return self
 
     def without_member(self, key: str) -> THasReadWriteOperations:
         self._data.pop(key, None)
+        self._caches().clear()
         return self
 
-    def get(self, key: Optional[str] = None, default: Optional[Any] = None) -> Optional[Any]:
-        return self._data.get(key, default)
+    def get(
+            self,
+            key: Optional[Union[str, Tuple[Union[str, int], ...]]] = None,
+            default: Optional[Any] = None,
+    ) -> Optional[Any]:
+        """
+        Provides the value of a top level member, or of a nested one when the key is
+        a tuple path like ('asset', 'params', 0, 'id'). Str steps read dictionary
+        members and int steps read list positions.
+        :param key: str|tuple The member key or the path to the nested member.
+        :param default: Any The value to return if the member does not exist.
+        :return: Any
+        """
+        if type(key) is not tuple:
+            return self._data.get(key, default)
+
+        value = self._data
+        for step in key:
+            if isinstance(value, dict) and isinstance(step, str):
+                if step not in value:
+                    return default
+                value = value[step]
+            elif isinstance(value, list) and type(step) is int and -len(value) <= step < len(value):
+                value = value[step]
+            else:
+                return default
+        return value
 
     def raw(self, deep_copy: bool = False) -> dict:
-        return deepcopy(self._data) if deep_copy else self._data
+        return clone(self._data) if deep_copy else self._data
+
+    def raw_view(self) -> Mapping[str, Any]:
+        """
+        Provides a read-only view of the business object data without copying it.
+        Only the top level is protected, nested members are the live objects.
+        :return: Mapping[str, Any]
+        """
+        return MappingProxyType(self._data)
+
+    def __deepcopy__(self, memo: dict) -> THasReadWriteOperations:
+        duplicate = object.__new__(type(self))
+        memo[id(self)] = duplicate
+        for name, value in _instance_state(self).items():
+            if name == '_data':
+                duplicate._data = clone(value)
+            elif name == '_cache':
+                # the caches point into the original data, the copy builds its own.
+                duplicate._cache = {}
+            else:
+                setattr(duplicate, name, deepcopy(value, memo))
+        return duplicate
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> THasReadWriteOperations:
+        """
+        Wraps the given dictionary skipping the constructor validation.
+        The caller must guarantee that data is a dictionary.
+        :param data: dict The trusted business object data.
+        :return: THasReadWriteOperations
+        """
+        adapter = object.__new__(cls)
+        adapter._data = data
+        adapter._cache = {}
+        return adapter
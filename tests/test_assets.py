@@ -1,6 +1,8 @@
+from copy import deepcopy
+
 import pytest
 from rndi.connect.business_objects.adapters import Asset
-from rndi.connect.business_objects.exceptions import MissingItemError
+from rndi.connect.business_objects.exceptions import MissingItemError, MissingParameterError
 
 
 def test_asset_builder_should_raise_value_error_on_invalid_init_value():
@@ -148,3 +150,221 @@ def test_asset_builder_should_build_successfully_a_valid_asset():
     assert param['id'] == a.configuration_param('AS_CFG_ID_001', 'id') == 'AS_CFG_ID_001'
     assert param['value'] == a.configuration_param('AS_CFG_ID_001', 'value') == 'Cfg value updated'
     assert param['value_error'] == a.configuration_param('AS_CFG_ID_001', 'value_error') == 'Cfg error value updated'
+
+
+def test_asset_builder_should_be_deep_copied_into_an_independent_asset():
+    a = Asset()
+    a.with_id('AS-001')
+    a.with_item('ITEM_ID_001', 'ITEM_MPN_001', params=[{'param_id': 'P_001', 'value': 'V_001'}])
+
+    c = deepcopy(a)
+    c.with_item_param('ITEM_ID_001', 'P_001', 'V_001_UPDATED')
+
+    assert isinstance(c, Asset)
+    assert c.id() == 'AS-001'
+    assert c.item_param('ITEM_ID_001', 'P_001', 'value') == 'V_001_UPDATED'
+    assert a.item_param('ITEM_ID_001', 'P_001', 'value') == 'V_001'
+
+
+def test_asset_builder_should_keep_subclass_state_on_deep_copy():
+    class TaggedAsset(Asset):
+        __slots__ = ('tags',)
+
+        def __init__(self, asset=None, tags=None):
+            super().__init__(asset)
+            self.tags = [] if tags is None else tags
+
+    class AnnotatedAsset(Asset):
+        def __init__(self, asset=None):
+            super().__init__(asset)
+            self.notes = {'origin': 'test'}
+
+    tagged = TaggedAsset({'id': 'AS-001'}, ['a'])
+    c = deepcopy(tagged)
+    assert isinstance(c, TaggedAsset)
+    assert c.id() == 'AS-001'
+    assert c.tags == ['a'] and c.tags is not tagged.tags
+
+    annotated = AnnotatedAsset({'id': 'AS-002'})
+    d = deepcopy(annotated)
+    assert d.notes == {'origin': 'test'} and d.notes is not annotated.notes
+    assert d.raw() == {'id': 'AS-002'} and d.raw() is not annotated.raw()
+
+
+def test_asset_builder_should_rebuild_item_lookups_when_items_are_removed():
+    a = Asset()
+    a.with_items([
+        {'item_id': 'ITEM_ID_001', 'item_mpn': 'ITEM_MPN_001'},
+        {'item_id': 'ITEM_ID_002', 'item_mpn': 'ITEM_MPN_002', 'params': [{'param_id': 'P_001', 'value': 'V'}]},
+    ])
+
+    assert a.item('ITEM_ID_002', 'mpn') == 'ITEM_MPN_002'
+    assert a.item_param('ITEM_ID_002', 'P_001', 'value') == 'V'
+
+    a.without_member('items')
+    with pytest.raises(MissingItemError):
+        a.item('ITEM_ID_002')
+
+    a.with_item('ITEM_ID_002', 'ITEM_MPN_002_NEW')
+    assert len(a.items()) == 1
+    assert a.item('ITEM_ID_002', 'mpn') == 'ITEM_MPN_002_NEW'
+    with pytest.raises(MissingItemError):
+        a.item_param('ITEM_ID_002', 'P_001')
+
+
+def test_asset_builder_should_not_allocate_an_instance_dict():
+    assert not hasattr(Asset(), '__dict__')
+
+
+def test_asset_builder_should_provide_the_items_by_column():
+    a = Asset()
+    a.with_items([
+        {'item_id': 'ITEM_ID_001', 'item_mpn': 'ITEM_MPN_001', 'quantity': '1'},
+        {'item_id': 'ITEM_ID_002', 'item_mpn': 'ITEM_MPN_002', 'quantity': '5'},
+    ])
+
+    columns = a.items_columns()
+    assert columns['id'] == ['ITEM_ID_001', 'ITEM_ID_002']
+    assert columns['mpn'] == ['ITEM_MPN_001', 'ITEM_MPN_002']
+    assert columns['quantity'] == ['1', '5']
+
+    columns['quantity'].append('10')
+    a.with_item('ITEM_ID_001', 'ITEM_MPN_001', quantity='3')
+    assert a.items_columns()['quantity'] == ['3', '5']
+
+    a.item('ITEM_ID_002')['quantity'] = '999'
+    assert a.items_columns()['quantity'] == ['3', '999']
+
+
+def test_asset_builder_should_merge_tiers_without_modifying_the_given_values():
+    contact_info = {'country': 'ES'}
+    a = Asset()
+    a.with_tier_customer({'id': 'TA-001', 'contact_info': contact_info})
+    a.with_tier_customer({'contact_info': {'city': 'Barcelona'}})
+
+    assert a.tier_customer('id') == 'TA-001'
+    assert a.tier_customer('contact_info') == {'country': 'ES', 'city': 'Barcelona'}
+    assert contact_info == {'country': 'ES'}
+
+
+def test_asset_builder_should_merge_a_tier_into_itself():
+    a = Asset()
+    a.with_tier_customer({'id': 'TA-001', 'tags': ['x']})
+    a.with_tier_customer(a.tier_customer())
+
+    assert a.tier_customer('id') == 'TA-001'
+    assert a.tier_customer('tags') == ['x', 'x']
+
+
+def test_asset_builder_should_provide_items_and_parameters_indexed_by_id():
+    a = Asset()
+    a.with_param('PARAM_ID_001', 'value-1')
+    a.with_configuration_param('CONF_PARAM_ID_001', 'conf-value-1')
+    a.with_items([
+        {'item_id': 'ITEM_ID_001', 'item_mpn': 'ITEM_MPN_001', 'params': [
+            {'param_id': 'ITEM_PARAM_ID_001', 'value': 'item-value-1'},
+        ]},
+    ])
+
+    assert a.params_map()['PARAM_ID_001']['value'] == 'value-1'
+    assert a.configuration_params_map()['CONF_PARAM_ID_001']['value'] == 'conf-value-1'
+    assert a.items_map()['ITEM_ID_001']['mpn'] == 'ITEM_MPN_001'
+    assert a.item_params_map('ITEM_ID_001')['ITEM_PARAM_ID_001']['value'] == 'item-value-1'
+
+    with pytest.raises(TypeError):
+        a.items_map()['ITEM_ID_002'] = {}
+
+    a.with_item('ITEM_ID_002', 'ITEM_MPN_002')
+    assert list(a.items_map()) == ['ITEM_ID_001', 'ITEM_ID_002']
+
+    replacement = {'id': 'ITEM_ID_001', 'mpn': 'ITEM_MPN_001_NEW'}
+    a.raw()['items'][0] = replacement
+    a.raw()['items'].pop()
+    assert dict(a.items_map()) == {'ITEM_ID_001': replacement}
+
+
+def test_asset_builder_should_not_serve_stale_items_after_raw_edits():
+    a = Asset()
+    a.with_items([
+        {'item_id': 'ITEM_ID_001', 'item_mpn': 'ITEM_MPN_001', 'params': [{'param_id': 'P_001', 'value': 'V1'}]},
+        {'item_id': 'ITEM_ID_002', 'item_mpn': 'ITEM_MPN_002'},
+    ])
+    a.with_configuration_params([{'param_id': 'CONF_001', 'value': 'C1'}])
+    assert a.item('ITEM_ID_001', 'mpn') == 'ITEM_MPN_001'
+    assert a.item_param('ITEM_ID_001', 'P_001', 'value') == 'V1'
+    assert a.configuration_param('CONF_001', 'value') == 'C1'
+
+    a.raw()['items'][0] = {'id': 'ITEM_ID_001', 'mpn': 'ITEM_MPN_001_NEW', 'params': [{'id': 'P_001', 'value': 'V2'}]}
+    assert a.item('ITEM_ID_001', 'mpn') == 'ITEM_MPN_001_NEW'
+    assert a.item_param('ITEM_ID_001', 'P_001', 'value') == 'V2'
+
+    a.raw()['items'].pop()
+    a.raw()['items'].append({'id': 'ITEM_ID_003', 'mpn': 'ITEM_MPN_003'})
+    assert a.item('ITEM_ID_003', 'mpn') == 'ITEM_MPN_003'
+    with pytest.raises(MissingItemError):
+        a.item('ITEM_ID_002')
+
+    a.raw()['configuration']['params'][0]['id'] = 'CONF_000'
+    assert a.configuration_param('CONF_000', 'value') == 'C1'
+    with pytest.raises(MissingParameterError):
+        a.configuration_param('CONF_001')
+
+
+def test_asset_builder_should_replace_null_members_on_write():
+    a = Asset({
+        'connection': {'provider': None, 'vendor': None, 'hub': None},
+        'contract': None,
+        'marketplace': None,
+        'product': None,
+        'params': None,
+        'items': None,
+        'tiers': {'customer': None},
+        'configuration': {'params': None},
+    })
+    a.with_connection_provider('PA-000-000', 'Provider')
+    a.with_connection_vendor('VA-000-000', 'Vendor')
+    a.with_connection_hub('HB-0000-0000', 'Hub')
+    a.with_contract('CRD-00000-00000-00000')
+    a.with_marketplace('MP-12345')
+    a.with_product('PRD-000-000-000')
+    a.with_param('PARAM_ID_001', 'value')
+    a.with_configuration_param('CONF_PARAM_ID_001', 'value')
+    a.with_tier_customer('TA-0000-0000-0000')
+    a.with_item('ITEM_ID_001', 'ITEM_MPN_001')
+
+    assert a.connection_provider('id') == 'PA-000-000'
+    assert a.connection_vendor('id') == 'VA-000-000'
+    assert a.connection_hub('id') == 'HB-0000-0000'
+    assert a.contract('id') == 'CRD-00000-00000-00000'
+    assert a.marketplace('id') == 'MP-12345'
+    assert a.product('id') == 'PRD-000-000-000'
+    assert a.param('PARAM_ID_001', 'value') == 'value'
+    assert a.configuration_param('CONF_PARAM_ID_001', 'value') == 'value'
+    assert a.tier_customer('id') == 'TA-0000-0000-0000'
+    assert a.item('ITEM_ID_001', 'mpn') == 'ITEM_MPN_001'
+
+
+def test_asset_builder_should_validate_bulk_item_entries():
+    a = Asset()
+    a.with_items([{'id': 'ITEM_ID_001', 'item_mpn': 'ITEM_MPN_001', 'params': [{'id': 'P_001', 'value': 'V'}]}])
+    a.with_configuration_params([{'id': 'CONF_001', 'value': 'C'}])
+
+    assert a.item('ITEM_ID_001', 'mpn') == 'ITEM_MPN_001'
+    assert a.item_param('ITEM_ID_001', 'P_001', 'value') == 'V'
+    assert a.configuration_param('CONF_001', 'value') == 'C'
+
+    with pytest.raises(TypeError):
+        a.with_items([{'item_id': 'ITEM_ID_002', 'item_mpn': 'ITEM_MPN_002', 'quantiy': '2'}])
+    with pytest.raises(TypeError):
+        a.with_item_params('ITEM_ID_001', [{'param_id': 'P_002', 'valeu': 'V'}])
+    with pytest.raises(TypeError):
+        a.with_configuration_params([{'param_id': 'CONF_002', 'valeu': 'C'}])
+
+
+def test_asset_builder_should_not_write_members_on_empty_bulk_calls():
+    a = Asset()
+    a.with_params([])
+    a.with_configuration_params([])
+    a.with_items([])
+
+    assert a.raw() == {}
@@ -1,8 +1,10 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
-from rndi.connect.business_objects.adapters import Request
-from rndi.connect.business_objects.helpers import merge, request_model
+from rndi.connect.business_objects.adapters import Asset, Request
+from rndi.connect.business_objects.exceptions import MissingParameterError
+from rndi.connect.business_objects.helpers import clone, make_param, make_tier, merge, request_model, update_param
+from rndi.connect.business_objects.mixin import HasParameters, HasReadWriteOperations
 
 NOTE = 'A note'
 REASON = 'A reason'
@@ -39,6 +41,63 @@ def test_merge_should_merge_complex_structures():
     assert merged['asset']['status'] == 'suspended'
     assert merged['asset']['params'][0]['id'] == 1
     assert merged['asset']['params'][1]['id'] == 2
+    assert base['asset']['status'] == 'active'
+    assert len(base['asset']['params']) == 1
+
+    merged['asset']['params'][1]['id'] = 3
+    assert override['asset']['params'][0]['id'] == 2
+
+
+def test_clone_should_deep_copy_json_like_structures():
+    created = datetime.fromisoformat('2022-03-25T13:12:22+00:00')
+    base = {
+        'id': 1,
+        'asset': {'status': 'active', 'params': [{'id': 1, 'value': None}]},
+        'created': created,
+    }
+
+    cloned = clone(base)
+
+    assert cloned == base
+    assert cloned is not base
+    assert cloned['asset'] is not base['asset']
+    assert cloned['asset']['params'] is not base['asset']['params']
+    assert cloned['asset']['params'][0] is not base['asset']['params'][0]
+    assert cloned['created'] == created
+
+
+def test_make_tier_should_accept_a_single_locale_or_a_list_of_locales():
+    for locale in [None, 'en_US', ['en_US'], ['es_ES', 'en_US']]:
+        tier = make_tier('customer', locale)
+        assert tier['type'] == 'customer'
+        assert tier['name']
+
+
+def test_update_param_should_write_the_same_members_as_make_param():
+    for args in [
+        ('P_001',),
+        ('P_001', 'value', 'error', 'email'),
+        ('P_001', {'key': 'value'}, None, 'object', 'Title', 'Description', 'item', 'configuration'),
+        ('P_001', ['value-1', 'value-2'], None, 'checkbox'),
+    ]:
+        members = {k: v for k, v in make_param(*args).items() if v is not None}
+        assert update_param({}, *args) == members
+
+    assert 'structured_value' in make_param('P_001', ['value-1'])
+
+    assert list(make_param('P_001').items()) == [
+        ('id', 'P_001'),
+        ('value', None),
+        ('value_error', None),
+        ('title', 'Parameter P_001 title.'),
+        ('description', 'Parameter P_001 description.'),
+        ('type', 'text'),
+        ('scope', None),
+        ('phase', None),
+    ]
+    assert list(make_param('P_002', {'key': 'value'}, 'error', 'object', 'Title', 'Description', 'item', 'config')) == [
+        'id', 'structured_value', 'value_error', 'title', 'description', 'type', 'scope', 'phase',
+    ]
 
 
 def _shared_request_assertions(raw: dict, r: Request):
@@ -75,6 +134,11 @@ def test_request_model_should_successfully_return_the_request_model():
     undefined_request = {}
     assert 'undefined' == request_model(undefined_request)
 
+    assert 'asset' == request_model({'type': 'adjustment', 'asset': {}, 'configuration': {}})
+    assert 'undefined' == request_model({'type': 'setup', 'asset': {}})
+    assert 'undefined' == request_model({'type': ['purchase'], 'asset': {}})
+    assert 'undefined' == request_model({'type': {}, 'configuration': {}})
+
 
 def test_request_builder_should_raise_value_error_on_invalid_init_value():
     with pytest.raises(ValueError):
@@ -216,3 +280,206 @@ def test_request_builder_should_properly_implement_read_write_operations_mixin()
     r.with_member('id', rid)
 
     assert r.get('id') == rid
+
+    r.with_asset(Asset().with_connection('CT-0000-0000', 'test').with_connection_provider('PA-000-000'))
+
+    assert r.get(('asset', 'connection', 'provider', 'id')) == 'PA-000-000'
+    assert r.get(('asset', 'connection', 'vendor', 'id'), 'VA-000-000') == 'VA-000-000'
+    assert r.get(('id', 'unknown')) is None
+    assert r.get(('id', 0)) is None
+    assert r.get(('id', 0), 'default') == 'default'
+    assert r.get(('asset', 0)) is None
+    assert r.get(('asset', 'connection', 'provider', 'id', 'unknown')) is None
+
+    r.with_param('P_001', 'P_001-Value')
+    assert r.get(('params', 0, 'id')) == 'P_001'
+    assert r.get(('params', -1, 'value')) == 'P_001-Value'
+    assert r.get(('params', 1, 'id')) is None
+    assert r.get(('params', '0', 'id')) is None
+    assert r.get(('params', True, 'id')) is None
+
+    cloned = r.raw(deep_copy=True)
+    cloned['id'] = 'PR-000-000-003'
+
+    assert r.id() == rid
+
+    view = r.raw_view()
+    assert view['id'] == rid
+    with pytest.raises(TypeError):
+        view['id'] = 'PR-000-000-003'
+
+
+def test_request_builder_should_keep_parameter_lookups_in_sync_with_raw_data():
+    r = Request()
+    r.with_params([
+        {'param_id': 'P_001', 'value': 'P_001-Value'},
+        {'param_id': 'P_002', 'value': 'P_002-Value'},
+    ])
+
+    assert r.param('P_002', 'value') == 'P_002-Value'
+
+    r.raw()['params'].append({'id': 'P_003', 'value': 'P_003-Value'})
+    assert r.param('P_003', 'value') == 'P_003-Value'
+
+    r.raw()['params'][0]['id'] = 'P_000'
+    with pytest.raises(MissingParameterError):
+        r.param('P_001')
+    assert r.param('P_000', 'value') == 'P_001-Value'
+
+    r.with_member('params', [{'id': 'P_004', 'value': 'P_004-Value'}])
+    assert r.param('P_004', 'value') == 'P_004-Value'
+    with pytest.raises(MissingParameterError):
+        r.param('P_002')
+
+
+def test_request_builder_should_not_serve_stale_parameters_after_raw_edits():
+    r = Request()
+    r.with_params([
+        {'param_id': 'P_001', 'value': 'P_001-Value'},
+        {'param_id': 'P_002', 'value': 'P_002-Value'},
+    ])
+    assert r.param('P_001', 'value') == 'P_001-Value'
+
+    replacement = {'id': 'P_001', 'value': 'P_001-Replaced'}
+    r.raw()['params'][0] = replacement
+    assert r.param('P_001') is replacement
+
+    r.with_param('P_001', 'P_001-Updated')
+    assert r.raw()['params'][0]['value'] == 'P_001-Updated'
+
+    removed = r.raw()['params'].pop(1)
+    r.raw()['params'].append({'id': 'P_003', 'value': 'P_003-Value'})
+    assert r.param('P_003', 'value') == 'P_003-Value'
+    with pytest.raises(MissingParameterError):
+        r.param(removed['id'])
+
+    r.raw()['params'][0]['id'] = 'P_000'
+    assert r.param('P_000', 'value') == 'P_001-Updated'
+    with pytest.raises(MissingParameterError):
+        r.param('P_001')
+
+
+def test_request_builder_should_replace_null_members_on_write():
+    r = Request({'events': {'created': None, 'updated': None}, 'assignee': None})
+    r.with_events(datetime(2022, 3, 25, 13, 12, 22), datetime(2022, 3, 26, 13, 12, 22))
+    r.with_assignee(USER_ID, USER_NAME, USER_EMAIL)
+
+    assert r.events('created') == {'at': '2022-03-25T13:12:22'}
+    assert r.events('updated') == {'at': '2022-03-26T13:12:22'}
+    assert r.assignee('id') == USER_ID
+
+
+def test_request_builder_should_validate_bulk_parameter_entries():
+    r = Request()
+    r.with_params([{'id': 'P_001', 'value': 'P_001-Value'}])
+    assert r.param('P_001', 'value') == 'P_001-Value'
+
+    with pytest.raises(TypeError):
+        r.with_params([{'param_id': 'P_002', 'valeu': 'P_002-Value'}])
+
+    with pytest.raises(TypeError):
+        r.with_params([{'value': 'P_003-Value'}])
+
+
+def test_request_model_should_be_refreshed_when_the_request_shape_changes():
+    r = Request()
+    r.with_type('purchase')
+
+    assert r.request_model() == 'undefined'
+
+    r.with_asset(r.asset())
+    assert r.is_asset_request()
+
+    r.without_member('asset')
+    r.with_type('setup')
+    r.with_tier_configuration(r.tier_configuration())
+    assert r.is_tier_config_request()
+
+    r.raw()['type'] = 'purchase'
+    assert r.request_model() == 'undefined'
+
+    r.raw()['asset'] = {}
+    assert r.is_asset_request()
+
+    del r.raw()['asset']
+    r.raw()['type'] = 'update'
+    assert r.is_tier_config_request()
+
+
+def test_request_builder_should_parse_dates_changed_through_raw_data():
+    r = Request()
+    r.with_created(datetime.fromisoformat('2022-03-25T13:12:22+00:00'))
+
+    assert r.created().isoformat() == '2022-03-25T13:12:22+00:00'
+
+    r.raw()['created'] = '2022-04-25T13:12:22+00:00'
+    assert r.created().isoformat() == '2022-04-25T13:12:22+00:00'
+
+    r.without_member('created')
+    assert r.created() is None
+
+
+def test_request_builder_should_return_the_parsed_dates_after_writing_them():
+    class Moment(datetime):
+        pass
+
+    r = Request()
+    r.with_updated(Moment(2022, 3, 25, 13, 12, 22, tzinfo=timezone.utc))
+
+    assert type(r.updated()) is datetime
+    assert r.updated() == Request({'updated': r.raw()['updated']}).updated()
+
+
+def test_request_builder_should_reuse_the_asset_wrapper_while_the_asset_is_unchanged():
+    r = Request({'type': 'purchase', 'asset': {'id': 'AS-001'}})
+
+    a = r.asset()
+    assert r.asset() is a
+    assert a.id() == 'AS-001'
+
+    r.with_member('asset', {'id': 'AS-002'})
+    assert r.asset() is not a
+    assert r.asset().id() == 'AS-002'
+
+    r.without_member('asset')
+    assert r.asset().raw() == {}
+    assert 'asset' not in r.raw()
+
+    r.raw()['asset'] = 'AS-003'
+    with pytest.raises(ValueError):
+        r.asset()
+
+    r.raw()['configuration'] = ['TC-001']
+    with pytest.raises(ValueError):
+        r.tier_configuration()
+
+
+def test_request_builder_should_wrap_trusted_data_without_validation():
+    data = {'id': 'PR-000-000-001', 'type': 'purchase', 'asset': {'id': 'AS-001'}}
+    r = Request.from_trusted(data)
+
+    assert isinstance(r, Request)
+    assert r.raw() is data
+    assert r.is_asset_request()
+    assert r.asset().id() == 'AS-001'
+
+
+def test_request_builder_should_not_allocate_an_instance_dict():
+    assert not hasattr(Request(), '__dict__')
+
+
+def test_mixins_should_work_on_classes_that_only_provide_data():
+    class Parameters(HasParameters, HasReadWriteOperations):
+        def __init__(self):
+            self._data = {}
+
+    p = Parameters()
+    p.with_param('P_001', 'P_001-Value')
+    assert p.param('P_001', 'value') == 'P_001-Value'
+
+    p.with_member('params', [{'id': 'P_002', 'value': 'P_002-Value'}])
+    assert p.param('P_002', 'value') == 'P_002-Value'
+
+    p.without_member('params')
+    with pytest.raises(MissingParameterError):
+        p.param('P_002')
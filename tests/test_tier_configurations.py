@@ -89,3 +89,11 @@ def test_tier_configuration_builder_should_build_successfully_a_valid_tier_confi
     assert raw['params'][2]['id'] == t.param('PARAM_ID_003', 'id') == 'PARAM_ID_003'
     assert raw['params'][2]['value'] == t.param('PARAM_ID_003', 'value') == ''
     assert raw['params'][2]['value_error'] == t.param('PARAM_ID_003', 'value_error') == 'Some value error'
+
+
+def test_tier_configuration_builder_should_not_allocate_an_instance_dict():
+    t = TierConfiguration()
+
+    assert not hasattr(t, '__dict__')
+    with pytest.raises(AttributeError):
+        t.undeclared = True